@@ -0,0 +1,55 @@
+"""
+Compare computing a cache key with `Encoder.dumps_with_digest()` and
+`Encoder.digest()` against `easyjson.dumps(obj, sort_keys=True)`
+followed by hashing the result.
+
+Run with `make bench` or `python3 -m benchmarks.bench_digest`.
+"""
+import hashlib
+import timeit
+from typing import Any, Callable
+
+import easyjson
+
+REPEAT = 5
+
+NUMBER = 3
+
+
+def best_ms(func: Callable[[], Any]) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1000
+
+
+def main() -> None:
+    encoder = easyjson.Encoder(canonical=True)
+    cases = {
+        "records": [
+            {"id": i, "name": f"user {i}", "tags": {"a", "b"}, "score": i / 7}
+            for i in range(20000)
+        ],
+        "text": [{"body": "lorem ipsum dolor sit amet " * 40, "n": i} for i in range(5000)],
+    }
+    print(
+        f"{'case':<10}{'dumps+sha (ms)':>16}{'with_digest (ms)':>18}{'digest (ms)':>13}"
+    )
+    for name, obj in cases.items():
+
+        def with_dumps() -> str:
+            text = easyjson.dumps(obj, sort_keys=True)
+            return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        def with_digest() -> str:
+            return encoder.dumps_with_digest(obj)[1].hexdigest()
+
+        def streamed() -> str:
+            return encoder.digest(obj).hexdigest()
+
+        assert with_digest() == streamed(), name
+        baseline = best_ms(with_dumps)
+        combined = best_ms(with_digest)
+        streaming = best_ms(streamed)
+        print(f"{name:<10}{baseline:>16.1f}{combined:>18.1f}{streaming:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compare indented encoding in easyjson against `json.dumps(indent=2)`.
+
+Run with `make bench` or `python3 -m benchmarks.bench_indent`.
+"""
+import json
+import random
+import timeit
+from typing import Any, Callable, Dict, List
+
+import easyjson
+
+REPEAT = 5
+
+NUMBER = 3
+
+
+def make_tree(depth: int, rng: random.Random) -> Any:
+    if depth == 0:
+        return rng.choice([1, 2.5, None, True, "text, with [brackets]", []])
+    if rng.random() < 0.5:
+        return [make_tree(depth - 1, rng) for _ in range(5)]
+    return {f"key_{i}": make_tree(depth - 1, rng) for i in range(5)}
+
+
+def make_records(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": i,
+            "name": f"user {i}",
+            "email": f"user{i}@example.com",
+            "score": i * 1.5,
+            "tags": ["a", "b", "c"],
+            "active": i % 2 == 0,
+            "meta": {"x": i, "y": None},
+        }
+        for i in range(count)
+    ]
+
+
+def make_matrix(rows: int, columns: int, rng: random.Random) -> List[List[float]]:
+    return [[rng.random() for _ in range(columns)] for _ in range(rows)]
+
+
+def best_ms(func: Callable[[], Any]) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1000
+
+
+def main() -> None:
+    rng = random.Random(0)
+    cases = {
+        "nested tree": make_tree(7, rng),
+        "records": make_records(20000),
+        "float matrix": make_matrix(2000, 100, rng),
+    }
+    print(
+        f"{'case':<14}{'sort_keys':>10}{'json (ms)':>12}"
+        f"{'easyjson (ms)':>15}{'speedup':>10}"
+    )
+    for name, obj in cases.items():
+        for sort_keys in (False, True):
+            expected = json.dumps(obj, indent=2, sort_keys=sort_keys)
+            actual = easyjson.dumps(obj, indent=2, sort_keys=sort_keys)
+            assert expected == actual, name
+            stdlib = best_ms(lambda: json.dumps(obj, indent=2, sort_keys=sort_keys))
+            ours = best_ms(lambda: easyjson.dumps(obj, indent=2, sort_keys=sort_keys))
+            print(
+                f"{name:<14}{str(sort_keys):>10}{stdlib:>12.1f}{ours:>15.1f}"
+                f"{stdlib / ours:>9.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
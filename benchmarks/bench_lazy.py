@@ -0,0 +1,80 @@
+"""
+Compare `easyjson.lazy_loads()` against `json.loads()` and
+`json.dumps()`, both for only reading a few fields and for reading a
+few fields and then re-emitting the whole document.
+
+Run with `make bench` or `python3 -m benchmarks.bench_lazy`.
+"""
+import json
+import timeit
+from typing import Any, Callable, Dict
+
+import easyjson
+
+REPEAT = 5
+
+NUMBER = 3
+
+
+def make_document(payload: Any) -> Dict[str, Any]:
+    return {"request_id": "abc", "user": {"id": 7}, "payload": payload}
+
+
+def best_ms(func: Callable[[], Any]) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=REPEAT)) / NUMBER * 1000
+
+
+def main() -> None:
+    cases = {
+        "records": make_document(
+            [
+                {"id": i, "name": f"user {i}", "tags": ["a", "b"], "meta": {"x": i}}
+                for i in range(20000)
+            ]
+        ),
+        "text": make_document(
+            [{"body": "lorem ipsum dolor sit amet " * 40, "n": i} for i in range(5000)]
+        ),
+    }
+    print(
+        f"{'case':<10}{'workload':<14}{'json (ms)':>12}{'lazy (ms)':>12}"
+        f"{'speedup':>10}"
+    )
+    for name, obj in cases.items():
+        document = json.dumps(obj).encode("utf-8")
+
+        def read_json() -> Any:
+            loaded = json.loads(document)
+            return loaded["user"]["id"], loaded["payload"][5]
+
+        def read_lazy() -> Any:
+            loaded = easyjson.lazy_loads(document)
+            return loaded["user"]["id"], loaded["payload"][5]
+
+        def dumps_json() -> str:
+            loaded = json.loads(document)
+            loaded["user"]["id"]
+            return json.dumps(loaded)
+
+        def dumps_lazy() -> str:
+            loaded = easyjson.lazy_loads(document)
+            loaded["user"]["id"]
+            return easyjson.dumps(loaded)
+
+        assert read_json() == read_lazy(), name
+        assert dumps_json() == dumps_lazy(), name
+        workloads = {
+            "read": (read_json, read_lazy),
+            "read+dumps": (dumps_json, dumps_lazy),
+        }
+        for workload, (with_json, with_lazy) in workloads.items():
+            stdlib = best_ms(with_json)
+            ours = best_ms(with_lazy)
+            print(
+                f"{name:<10}{workload:<14}{stdlib:>12.2f}{ours:>12.2f}"
+                f"{stdlib / ours:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
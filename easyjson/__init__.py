@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import dataclasses
+import hashlib
 import json
 from base64 import standard_b64encode
 from collections.abc import Mapping, Sequence, Set
@@ -18,9 +19,18 @@ from ipaddress import (
 )
 from pathlib import Path
 from types import NoneType
-from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union, cast
 from uuid import UUID
 
+from easyjson._canonical import canonical_encode, canonical_items
+from easyjson._indent import indented_encode
+from easyjson._lazy import LazyArray as LazyArray
+from easyjson._lazy import LazyObject as LazyObject
+from easyjson._lazy import LazyValue as LazyValue
+from easyjson._lazy import RawFragments
+from easyjson._lazy import lazy_loads as lazy_loads
+from easyjson._shared import SharedJSON as SharedJSON
+
 ONE_DAY_IN_SECONDS: int = 86400
 
 
@@ -42,6 +52,19 @@ DEFAULT_BASE64_PREFIX = "base64: "
 DEFAULT_TIMEDELTA_PREFIX = "Duration: "
 
 
+DEFAULT_ITEM_SEPARATOR = ", "
+
+
+DEFAULT_KEY_SEPARATOR = ": "
+
+
+CANONICAL_SEPARATORS: Tuple[str, str] = (",", ":")
+
+
+# How many encoded chunks are joined and hashed at once.
+DIGEST_BATCH_SIZE: int = 8192
+
+
 class SerializationError(TypeError):
     def __init__(self, obj: Any):
         obj_type = type(obj).__name__
@@ -91,6 +114,7 @@ class Encoder:
         use_dir: bool = False,
         base64_prefix: str = DEFAULT_BASE64_PREFIX,
         timedelta_prefix: str = DEFAULT_TIMEDELTA_PREFIX,
+        canonical: bool = False,
     ) -> None:
         self.decimal_as = decimal_as
         self.fraction_as = fraction_as
@@ -98,10 +122,66 @@ class Encoder:
         self.use_dir = use_dir
         self.base64_prefix = base64_prefix
         self.timedelta_prefix = timedelta_prefix
+        self.canonical = canonical
 
         class JSONEncoder(json.JSONEncoder):
+            raw_fragments: Optional[RawFragments] = None
+
+            def __init__(inner_self, **kwargs: Any) -> None:
+                super().__init__(**kwargs)
+                # Canonical output never depends on dict insertion order.
+                # Keys are sorted by the strings they are written as, see
+                # `canonical_items()`.
+                if self.canonical:
+                    inner_self.sort_keys = True
+
             def default(inner_self, obj: Any) -> JSON_TYPE:
+                raw_fragments = inner_self.raw_fragments
+                if raw_fragments is not None and isinstance(obj, LazyValue):
+                    raw = obj.raw
+                    if raw.isascii() or not inner_self.ensure_ascii:
+                        return raw_fragments.placeholder(raw)
+                # Sets are all the C encoder hands over in canonical
+                # containers, so they skip the checks in `obj_to_bare()`.
+                if self.canonical and isinstance(obj, (set, frozenset)):
+                    return self._sorted_set(obj)
                 return self.obj_to_bare(obj, recursive=False)
+
+            def encode(inner_self, o: Any) -> str:
+                # Lazy views are written back out verbatim, unless the
+                # output has to be reformatted or checked for NaN and
+                # infinities, which the original text may contain.
+                if (
+                    inner_self.indent is not None
+                    or inner_self.sort_keys
+                    or not inner_self.allow_nan
+                    or inner_self.item_separator != DEFAULT_ITEM_SEPARATOR
+                    or inner_self.key_separator != DEFAULT_KEY_SEPARATOR
+                ):
+                    return super().encode(o)
+                inner_self.raw_fragments = RawFragments()
+                try:
+                    return inner_self.raw_fragments.substitute(super().encode(o))
+                finally:
+                    inner_self.raw_fragments = None
+
+            def iterencode(
+                inner_self, o: Any, _one_shot: bool = False
+            ) -> Iterator[str]:
+                # The stdlib falls back to its pure-Python encoder whenever
+                # `indent` is set, so one-shot indented encoding goes through
+                # our own faster implementation instead. Neither stdlib
+                # encoder can sort mixed keys, so canonical encoding always
+                # goes through ours.
+                if self.canonical:
+                    if inner_self.indent is not None:
+                        chunks = indented_encode(inner_self, o, canonical_items)
+                    else:
+                        chunks = canonical_encode(inner_self, o)
+                    return iter(chunks)
+                if _one_shot and inner_self.indent is not None:
+                    return cast(Iterator[str], indented_encode(inner_self, o))
+                return super().iterencode(o, _one_shot)
         self._Encoder = JSONEncoder
 
     def _encode_bytes(self, obj: bytes) -> str:
@@ -146,6 +226,8 @@ class Encoder:
     def _decimal_to_str(self, obj: Decimal) -> Union[str, float, int]:
         # TODO(jamesmishra): Turn string types into enums.
         if self.decimal_as == "str":
+            if self.canonical:
+                return self._decimal_to_canonical_str(obj)
             return str(obj)
         if self.decimal_as == "float":
             return float(obj)
@@ -156,6 +238,45 @@ class Encoder:
             raise SerializationError(obj)
         raise RuntimeError("Unknown decimal_as value.")
 
+    def _decimal_to_canonical_str(self, obj: Decimal) -> str:
+        # Equal values such as 1.5, 1.50 and 15E-1 get the same rendering.
+        # Trailing zeros are stripped from the digits directly and the
+        # result is written the way `str()` writes a `Decimal`, since
+        # `normalize()` rounds or underflows values outside its context
+        # and the stripped exponent may not fit in any context.
+        if not obj.is_finite():
+            return str(obj)
+        if not obj:
+            return "0"
+        sign, digits, exponent = obj.as_tuple()
+        coefficient = "".join(map(str, digits)).rstrip("0")
+        exponent = cast(int, exponent) + len(digits) - len(coefficient)
+        adjusted = exponent + len(coefficient) - 1
+        prefix = "-" if sign else ""
+        if exponent > 0 or adjusted < -6:
+            if len(coefficient) > 1:
+                coefficient = coefficient[0] + "." + coefficient[1:]
+            return f"{prefix}{coefficient}E{adjusted:+d}"
+        point = len(coefficient) + exponent
+        if point <= 0:
+            return f"{prefix}0.{'0' * -point}{coefficient}"
+        if exponent == 0:
+            return prefix + coefficient
+        return f"{prefix}{coefficient[:point]}.{coefficient[point:]}"
+
+    def _canonical_sort_key(self, obj: Any) -> str:
+        return json.dumps(obj, cls=self._Encoder, separators=CANONICAL_SEPARATORS)
+
+    def _sorted_set(self, obj: Set[Any]) -> List[Any]:
+        # Sets of plain strings or integers sort directly. Anything else
+        # is ordered by its canonical encoding, which works across mixed
+        # types. Items only tie when they encode identically, so ties
+        # cannot change the output.
+        item_types = set(map(type, obj))
+        if item_types == {str} or item_types == {int}:
+            return sorted(obj)
+        return sorted(obj, key=self._canonical_sort_key)
+
     def _fraction_to_str(self, obj: Fraction) -> Union[str, float, int]:
         if self.fraction_as == "str":
             return str(obj)
@@ -189,6 +310,8 @@ class Encoder:
 
         # Converting list types
         if isinstance(obj, (Sequence, Set)):
+            if self.canonical and isinstance(obj, Set):
+                obj = self._sorted_set(obj)
             if recursive:
                 return [
                     self.obj_to_bare(item, recursive=True)
@@ -240,7 +363,7 @@ class Encoder:
         ensure_ascii: bool=True,
         check_circular: bool=True,
         allow_nan: bool=True,
-        indent: Optional[int]=None,
+        indent: Optional[Union[int, str]]=None,
         separators: Optional[Tuple[str, str]]=None,
         default: Optional[Callable[[Any], JSON_TYPE]]=None,
         sort_keys: bool=False,
@@ -258,6 +381,88 @@ class Encoder:
             sort_keys=sort_keys,
         )
 
+    def dump_shared(
+        self,
+        obj: Any,
+        *,
+        skipkeys: bool=False,
+        ensure_ascii: bool=True,
+        check_circular: bool=True,
+        allow_nan: bool=True,
+        indent: Optional[Union[int, str]]=None,
+        separators: Optional[Tuple[str, str]]=None,
+        default: Optional[Callable[[Any], JSON_TYPE]]=None,
+        sort_keys: bool=False,
+    ) -> SharedJSON:
+        """
+        Encode `obj` into a new shared memory segment and return a
+        small, picklable handle to it. Other processes read the payload
+        with `SharedJSON.open()` or `SharedJSON.loads()` instead of
+        receiving a pickled copy of the text.
+        """
+        text = self.dumps(
+            obj,
+            skipkeys=skipkeys,
+            ensure_ascii=ensure_ascii,
+            check_circular=check_circular,
+            allow_nan=allow_nan,
+            indent=indent,
+            separators=separators,
+            default=default,
+            sort_keys=sort_keys,
+        )
+        return SharedJSON.create(text.encode("utf-8"))
+
+    def _check_canonical(self, method: str) -> None:
+        if not self.canonical:
+            raise RuntimeError(f"{method}() requires an Encoder with canonical=True.")
+
+    def dumps_with_digest(
+        self,
+        obj: Any,
+        *,
+        algorithm: str="sha256",
+    ) -> Tuple[str, hashlib._Hash]:
+        """
+        Encode `obj` in canonical form and return the text along with a
+        `hashlib` object holding its digest, e.g. for an ETag.
+
+        The canonical form is compact, ASCII-only and has sorted keys,
+        so the digest only changes when the data does.
+        """
+        self._check_canonical("dumps_with_digest")
+        parts: List[str] = []
+        hasher = self._canonical_digest(obj, algorithm, parts)
+        return "".join(parts), hasher
+
+    def digest(self, obj: Any, *, algorithm: str="sha256") -> hashlib._Hash:
+        """
+        Return a `hashlib` object holding the digest of the canonical
+        form of `obj`, the same one `dumps_with_digest()` computes,
+        without keeping the encoded text.
+
+        Chunks are hashed in batches as the encoder produces them, so
+        the extra memory stays bounded however large `obj` is.
+        """
+        self._check_canonical("digest")
+        return self._canonical_digest(obj, algorithm, None)
+
+    def _canonical_digest(
+        self, obj: Any, algorithm: str, parts: Optional[List[str]]
+    ) -> hashlib._Hash:
+        # Feeds the hasher from the encoder's batches of chunks, also
+        # collecting them in `parts` when the text itself is wanted.
+        hasher = hashlib.new(algorithm)
+
+        def flush(text: str) -> None:
+            if parts is not None:
+                parts.append(text)
+            hasher.update(text.encode("utf-8"))
+
+        encoder = self._Encoder(separators=CANONICAL_SEPARATORS)
+        flush("".join(canonical_encode(encoder, obj, flush, DIGEST_BATCH_SIZE)))
+        return hasher
+
     def to_bare(self) -> Dict[str, Union[str, bool, None]]:
         return dict(
             decimal_as=self.decimal_as,
@@ -266,6 +471,7 @@ class Encoder:
             use_dir=self.use_dir,
             base64_prefix=self.base64_prefix,
             timedelta_prefix=self.timedelta_prefix,
+            canonical=self.canonical,
         )
 
 default_encoder = Encoder()
@@ -278,7 +484,7 @@ def dumps(
     ensure_ascii: bool=True,
     check_circular: bool=True,
     allow_nan: bool=True,
-    indent: Optional[int]=None,
+    indent: Optional[Union[int, str]]=None,
     separators: Optional[Tuple[str, str]]=None,
     default: Optional[Callable[..., Any]]=None,
     sort_keys: bool=False,
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import json
+import sys
+from json.encoder import INFINITY, encode_basestring, encode_basestring_ascii
+from types import NoneType
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+try:
+    from _json import make_encoder as c_make_encoder
+except ImportError:
+    c_make_encoder = None  # type: ignore[assignment,misc]
+
+# Without indentation a container's text needs no splicing, so even
+# small ones are cheaper to hand to the C encoder than to walk.
+LEAF_MIN_LENGTH = 2
+
+
+def _key_to_str(key: Any, allow_nan: bool, skipkeys: bool) -> Optional[str]:
+    """
+    Return the string the stdlib encoder writes for a mapping key, or
+    None if the key is skipped.
+    """
+    if isinstance(key, str):
+        return key
+    if isinstance(key, float):
+        if key != key:
+            text = "NaN"
+        elif key == INFINITY:
+            text = "Infinity"
+        elif key == -INFINITY:
+            text = "-Infinity"
+        else:
+            return float.__repr__(key)
+        if not allow_nan:
+            raise ValueError(
+                "Out of range float values are not JSON compliant: " + repr(key)
+            )
+        return text
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if skipkeys:
+        return None
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+    )
+
+
+def canonical_items(
+    encoder: json.JSONEncoder, dct: Dict[Any, Any]
+) -> List[Tuple[Any, Any]]:
+    """
+    Return the items of `dct` ordered by the string each key is written
+    as, so that `1`, `"b"` and `None` sort as `"1"`, `"b"` and `"null"`.
+
+    Keys are only converted when a non-str key is met. Sorting raises
+    `TypeError` whenever str and other keys are mixed, and otherwise
+    puts a non-str key first. Keys that collide once converted, such as
+    `1` and `"1"`, raise `ValueError` because no order between them
+    would be canonical.
+    """
+    try:
+        items = sorted(dct.items())
+    except TypeError:
+        pass
+    else:
+        if not items or isinstance(items[0][0], str):
+            return items
+    converted: Dict[str, Any] = {}
+    for key, value in dct.items():
+        text = _key_to_str(key, encoder.allow_nan, encoder.skipkeys)
+        if text is None:
+            continue
+        if text in converted:
+            raise ValueError(f"Keys collide once converted to strings: {text!r}")
+        converted[text] = value
+    return sorted(converted.items())
+
+
+def canonical_encode(
+    encoder: json.JSONEncoder,
+    o: Any,
+    flush: Optional[Callable[[str], None]] = None,
+    batch_size: int = sys.maxsize,
+) -> List[str]:
+    """
+    Encode `o` without indentation and with keys ordered by
+    `canonical_items()`, producing the text
+    `json.JSONEncoder.iterencode()` would if it could sort mixed keys.
+
+    Containers are walked in Python, as in `indented_encode()`, until
+    one only holds flat values: plain scalars, sets, or containers of
+    those whose keys are all strings. It is then handed to the C
+    encoder in a single call, which sorts string keys the same way.
+    Set members are hashable, so they never hold dicts whose keys
+    would need converting.
+
+    Once `batch_size` chunks have piled up they are joined and passed
+    to `flush`, and long flat lists are encoded `batch_size` items at a
+    time. The chunks left over at the end are returned.
+    """
+    key_separator = encoder.key_separator
+    separator = encoder.item_separator
+    skipkeys = encoder.skipkeys
+    allow_nan = encoder.allow_nan
+    ensure_ascii = encoder.ensure_ascii
+    default = encoder.default
+    markers: Optional[Dict[int, Any]] = {} if encoder.check_circular else None
+    encode_str = encode_basestring_ascii if ensure_ascii else encode_basestring
+    int_repr = int.__repr__
+    float_repr = float.__repr__
+
+    # The C encoder words its out-of-range float error differently,
+    # so floats only take the fast path when they cannot raise.
+    leaf_types: FrozenSet[type] = frozenset()
+    leaf_encode: Optional[Callable[[Any, int], Any]] = None
+    if c_make_encoder is not None:
+        leaf_types = frozenset(
+            (str, int, float, bool, NoneType, set, frozenset)
+            if allow_nan
+            else (str, int, bool, NoneType, set, frozenset)
+        )
+        leaf_encode = c_make_encoder(
+            None,
+            default,
+            encode_str,
+            None,
+            key_separator,
+            separator,
+            True,
+            skipkeys,
+            allow_nan,
+        )
+
+    # Documents tend to repeat the same keys, so their encoded form
+    # (with the key separator) is computed once per call.
+    key_texts: Dict[str, str] = {}
+
+    chunks: List[str] = []
+    append = chunks.append
+
+    def flush_chunks() -> None:
+        assert flush is not None
+        flush("".join(chunks))
+        chunks.clear()
+
+    def is_flat(o: Any) -> bool:
+        cls = type(o)
+        if cls in leaf_types:
+            return True
+        if cls is list:
+            return leaf_types.issuperset(map(type, o))
+        if cls is dict:
+            return leaf_types.issuperset(map(type, o.values())) and {
+                str
+            }.issuperset(map(type, o))
+        return False
+
+    def floatstr(o: float) -> str:
+        if o != o:
+            text = "NaN"
+        elif o == INFINITY:
+            text = "Infinity"
+        elif o == -INFINITY:
+            text = "-Infinity"
+        else:
+            return float_repr(o)
+        if not allow_nan:
+            raise ValueError(
+                "Out of range float values are not JSON compliant: " + repr(o)
+            )
+        return text
+
+    def encode_value(o: Any) -> None:
+        if isinstance(o, str):
+            append(encode_str(o))
+        elif o is None:
+            append("null")
+        elif o is True:
+            append("true")
+        elif o is False:
+            append("false")
+        elif isinstance(o, int):
+            append(int_repr(o))
+        elif isinstance(o, float):
+            append(floatstr(o))
+        elif isinstance(o, (list, tuple)):
+            encode_list(o)
+        elif isinstance(o, dict):
+            encode_dict(o)
+        else:
+            if markers is not None:
+                marker_id = id(o)
+                if marker_id in markers:
+                    raise ValueError("Circular reference detected")
+                markers[marker_id] = o
+            encode_value(default(o))
+            if markers is not None:
+                del markers[marker_id]
+
+    def encode_list(lst: Any) -> None:
+        if not lst:
+            append("[]")
+            return
+        if markers is not None:
+            marker_id = id(lst)
+            if marker_id in markers:
+                raise ValueError("Circular reference detected")
+            markers[marker_id] = lst
+        if (
+            leaf_encode is not None
+            and len(lst) >= LEAF_MIN_LENGTH
+            and (leaf_types.issuperset(map(type, lst)) or all(map(is_flat, lst)))
+        ):
+            if len(lst) <= batch_size:
+                append("".join(leaf_encode(lst, 0)))
+            else:
+                append("[")
+                for start in range(0, len(lst), batch_size):
+                    if start:
+                        append(separator)
+                    text = "".join(leaf_encode(lst[start : start + batch_size], 0))
+                    append(text[1:-1])
+                    flush_chunks()
+                append("]")
+        else:
+            append("[")
+            first = True
+            for value in lst:
+                if first:
+                    first = False
+                else:
+                    append(separator)
+                cls = type(value)
+                if cls is str:
+                    append(encode_str(value))
+                elif cls is int:
+                    append(int_repr(value))
+                elif cls is float:
+                    append(floatstr(value))
+                elif value is None:
+                    append("null")
+                elif value is True:
+                    append("true")
+                elif value is False:
+                    append("false")
+                elif cls is dict:
+                    encode_dict(value)
+                elif cls is list:
+                    encode_list(value)
+                else:
+                    encode_value(value)
+                if len(chunks) >= batch_size:
+                    flush_chunks()
+            append("]")
+        if markers is not None:
+            del markers[marker_id]
+
+    def encode_dict(dct: Any) -> None:
+        if not dct:
+            append("{}")
+            return
+        if markers is not None:
+            marker_id = id(dct)
+            if marker_id in markers:
+                raise ValueError("Circular reference detected")
+            markers[marker_id] = dct
+        if (
+            leaf_encode is not None
+            and len(dct) >= LEAF_MIN_LENGTH
+            and {str}.issuperset(map(type, dct))
+            and all(map(is_flat, dct.values()))
+        ):
+            append("".join(leaf_encode(dct, 0)))
+        else:
+            append("{")
+            first = True
+            for key, value in canonical_items(encoder, dct):
+                key_cls = type(key)
+                if key_cls is str:
+                    key_text = key_texts.get(key)
+                    if key_text is None:
+                        key_text = key_texts[key] = encode_str(key) + key_separator
+                elif isinstance(key, str):
+                    key_text = encode_str(key) + key_separator
+                elif skipkeys:
+                    continue
+                else:
+                    raise TypeError(
+                        "keys must be str, int, float, bool or None, "
+                        f"not {key.__class__.__name__}"
+                    )
+                if first:
+                    first = False
+                else:
+                    append(separator)
+                append(key_text)
+                cls = type(value)
+                if cls is str:
+                    append(encode_str(value))
+                elif cls is int:
+                    append(int_repr(value))
+                elif cls is float:
+                    append(floatstr(value))
+                elif value is None:
+                    append("null")
+                elif value is True:
+                    append("true")
+                elif value is False:
+                    append("false")
+                elif cls is dict:
+                    encode_dict(value)
+                elif cls is list:
+                    encode_list(value)
+                else:
+                    encode_value(value)
+                if len(chunks) >= batch_size:
+                    flush_chunks()
+            append("}")
+        if markers is not None:
+            del markers[marker_id]
+
+    encode_value(o)
+    return chunks
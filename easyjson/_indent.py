@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import json
+from json.encoder import INFINITY, encode_basestring, encode_basestring_ascii
+from types import NoneType
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+try:
+    from _json import make_encoder as c_make_encoder
+except ImportError:
+    c_make_encoder = None  # type: ignore[assignment,misc]
+
+# Handing a container to the C encoder has a fixed cost that only pays
+# off once the container holds a handful of values.
+LEAF_MIN_LENGTH = 8
+
+
+def indented_encode(
+    encoder: json.JSONEncoder,
+    o: Any,
+    sort_items: Optional[
+        Callable[[json.JSONEncoder, Dict[Any, Any]], List[Tuple[Any, Any]]]
+    ] = None,
+) -> List[str]:
+    """
+    Encode `o` with indentation, producing the same chunks of text
+    that `json.JSONEncoder.iterencode()` would.
+
+    The stdlib drops the C encoder entirely as soon as `indent` is
+    set. Here the containers are walked in Python, appending to one
+    list instead of chaining generators, and every container whose
+    values are all plain scalars is handed to the C encoder in a
+    single call with the separator for its depth.
+
+    `sort_items`, if given, orders the items of every dict in place of
+    `sort_keys`. Dicts then only reach the C encoder when all of their
+    keys are strings, which it sorts the same way.
+    """
+    indent = encoder.indent
+    if not isinstance(indent, str):
+        indent = " " * indent
+    key_separator = encoder.key_separator
+    item_separator = encoder.item_separator
+    skipkeys = encoder.skipkeys
+    sort_keys = encoder.sort_keys
+    allow_nan = encoder.allow_nan
+    ensure_ascii = encoder.ensure_ascii
+    default = encoder.default
+    markers: Optional[Dict[int, Any]] = {} if encoder.check_circular else None
+    encode_str = encode_basestring_ascii if ensure_ascii else encode_basestring
+    int_repr = int.__repr__
+    float_repr = float.__repr__
+
+    # The C encoder words its out-of-range float error differently,
+    # so floats only take the fast path when they cannot raise.
+    leaf_types: FrozenSet[type] = frozenset()
+    if c_make_encoder is not None:
+        leaf_types = frozenset(
+            (str, int, float, bool, NoneType)
+            if allow_nan
+            else (str, int, bool, NoneType)
+        )
+
+    newlines: List[str] = ["\n"]
+    separators: List[str] = [item_separator + "\n"]
+    # Documents tend to repeat the same keys, so their encoded form
+    # (with the key separator) is computed once per call.
+    key_texts: Dict[str, str] = {}
+    leaf_encoders: List[Optional[Callable[[Any, int], Sequence[str]]]] = [None]
+
+    chunks: List[str] = []
+    append = chunks.append
+
+    def floatstr(o: float) -> str:
+        if o != o:
+            text = "NaN"
+        elif o == INFINITY:
+            text = "Infinity"
+        elif o == -INFINITY:
+            text = "-Infinity"
+        else:
+            return float_repr(o)
+        if not allow_nan:
+            raise ValueError(
+                "Out of range float values are not JSON compliant: " + repr(o)
+            )
+        return text
+
+    def enter(depth: int) -> None:
+        if depth == len(newlines):
+            newlines.append(newlines[-1] + indent)
+            separators.append(separators[-1] + indent)
+            leaf_encoders.append(None)
+
+    def encode_leaf(o: Any, depth: int) -> None:
+        leaf_encode = leaf_encoders[depth]
+        if leaf_encode is None:
+            leaf_encode = c_make_encoder(
+                None,
+                default,
+                encode_str,
+                None,
+                key_separator,
+                separators[depth],
+                sort_keys,
+                skipkeys,
+                allow_nan,
+            )
+            leaf_encoders[depth] = leaf_encode
+        text = "".join(leaf_encode(o, 0))
+        append(text[0])
+        append(newlines[depth])
+        append(text[1:-1])
+        append(newlines[depth - 1])
+        append(text[-1])
+
+    def encode_value(o: Any, depth: int) -> None:
+        if isinstance(o, str):
+            append(encode_str(o))
+        elif o is None:
+            append("null")
+        elif o is True:
+            append("true")
+        elif o is False:
+            append("false")
+        elif isinstance(o, int):
+            append(int_repr(o))
+        elif isinstance(o, float):
+            append(floatstr(o))
+        elif isinstance(o, (list, tuple)):
+            encode_list(o, depth)
+        elif isinstance(o, dict):
+            encode_dict(o, depth)
+        else:
+            if markers is not None:
+                marker_id = id(o)
+                if marker_id in markers:
+                    raise ValueError("Circular reference detected")
+                markers[marker_id] = o
+            encode_value(default(o), depth)
+            if markers is not None:
+                del markers[marker_id]
+
+    def encode_list(lst: Any, depth: int) -> None:
+        if not lst:
+            append("[]")
+            return
+        if markers is not None:
+            marker_id = id(lst)
+            if marker_id in markers:
+                raise ValueError("Circular reference detected")
+            markers[marker_id] = lst
+        depth += 1
+        enter(depth)
+        if len(lst) >= LEAF_MIN_LENGTH and leaf_types.issuperset(map(type, lst)):
+            encode_leaf(lst, depth)
+        else:
+            append("[")
+            append(newlines[depth])
+            separator = separators[depth]
+            first = True
+            for value in lst:
+                if first:
+                    first = False
+                else:
+                    append(separator)
+                cls = type(value)
+                if cls is str:
+                    append(encode_str(value))
+                elif cls is int:
+                    append(int_repr(value))
+                elif cls is float:
+                    append(floatstr(value))
+                elif value is None:
+                    append("null")
+                elif value is True:
+                    append("true")
+                elif value is False:
+                    append("false")
+                elif cls is dict:
+                    encode_dict(value, depth)
+                elif cls is list:
+                    encode_list(value, depth)
+                else:
+                    encode_value(value, depth)
+            append(newlines[depth - 1])
+            append("]")
+        if markers is not None:
+            del markers[marker_id]
+
+    def encode_dict(dct: Any, depth: int) -> None:
+        if not dct:
+            append("{}")
+            return
+        if markers is not None:
+            marker_id = id(dct)
+            if marker_id in markers:
+                raise ValueError("Circular reference detected")
+            markers[marker_id] = dct
+        depth += 1
+        enter(depth)
+        if (
+            len(dct) >= LEAF_MIN_LENGTH
+            and leaf_types.issuperset(map(type, dct.values()))
+            and (sort_items is None or {str}.issuperset(map(type, dct)))
+        ):
+            encode_leaf(dct, depth)
+        else:
+            append("{")
+            append(newlines[depth])
+            separator = separators[depth]
+            first = True
+            items: Any
+            if sort_items is not None:
+                items = sort_items(encoder, dct)
+            elif sort_keys:
+                items = sorted(dct.items())
+            else:
+                items = dct.items()
+            for key, value in items:
+                key_cls = type(key)
+                if key_cls is str:
+                    key_text = key_texts.get(key)
+                    if key_text is None:
+                        key_text = key_texts[key] = encode_str(key) + key_separator
+                else:
+                    if isinstance(key, str):
+                        pass
+                    elif isinstance(key, float):
+                        key = floatstr(key)
+                    elif key is True:
+                        key = "true"
+                    elif key is False:
+                        key = "false"
+                    elif key is None:
+                        key = "null"
+                    elif isinstance(key, int):
+                        key = int_repr(key)
+                    elif skipkeys:
+                        continue
+                    else:
+                        raise TypeError(
+                            "keys must be str, int, float, bool or None, "
+                            f"not {key.__class__.__name__}"
+                        )
+                    key_text = encode_str(key) + key_separator
+                if first:
+                    first = False
+                else:
+                    append(separator)
+                append(key_text)
+                cls = type(value)
+                if cls is str:
+                    append(encode_str(value))
+                elif cls is int:
+                    append(int_repr(value))
+                elif cls is float:
+                    append(floatstr(value))
+                elif value is None:
+                    append("null")
+                elif value is True:
+                    append("true")
+                elif value is False:
+                    append("false")
+                elif cls is dict:
+                    encode_dict(value, depth)
+                elif cls is list:
+                    encode_list(value, depth)
+                else:
+                    encode_value(value, depth)
+            append(newlines[depth - 1])
+            append("}")
+        if markers is not None:
+            del markers[marker_id]
+
+    encode_value(o, 0)
+    return chunks
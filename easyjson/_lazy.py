@@ -0,0 +1,465 @@
+from __future__ import annotations
+
+import json
+import re
+import secrets
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union, overload
+
+_WS = r"[ \t\n\r]*+"
+
+_STRING = (
+    r'"[^"\\\x00-\x1f]*+'
+    r'(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*+)*+"'
+)
+
+_NUMBER = r"-?(?:0|[1-9][0-9]*+)(?:\.[0-9]++)?+(?:[eE][-+]?+[0-9]++)?+"
+
+_SCALAR = rf"(?>{_STRING}|{_NUMBER}|true|false|null|NaN|-?Infinity)"
+
+
+def _container_pattern(value: str) -> str:
+    """A pattern for an array or object whose values all match `value`."""
+    array = rf"\[{_WS}(?:\]|{value}{_WS}(?:,{_WS}{value}{_WS})*+\])"
+    member = rf"{_STRING}{_WS}:{_WS}{value}{_WS}"
+    obj = rf"\{{{_WS}(?:\}}|{member}(?:,{_WS}{member})*+\}})"
+    return rf"(?>{array}|{obj})"
+
+
+# Containers nested at most two deep are checked by a single match.
+# Deeper ones are walked one level at a time by `_skip()`.
+_SMALL_CONTAINER = re.compile(
+    _container_pattern(rf"(?>{_SCALAR}|{_container_pattern(_SCALAR)})")
+)
+
+_SCALAR_RE = re.compile(_SCALAR)
+
+_KEY = re.compile(rf"{_STRING}{_WS}:{_WS}")
+
+# The scalar members that follow a value, up to the next container
+# value or the closing bracket.
+_ARRAY_TAIL = re.compile(rf"{_WS}(?:,{_WS}{_SCALAR}{_WS})*+")
+
+_OBJECT_TAIL = re.compile(rf"{_WS}(?:,{_WS}{_STRING}{_WS}:{_WS}{_SCALAR}{_WS})*+")
+
+_WHITESPACE = re.compile(_WS)
+
+_WHITESPACE_CHARS = " \t\n\r"
+
+
+def _skip_whitespace(text: str, position: int) -> int:
+    if position < len(text) and text[position] in _WHITESPACE_CHARS:
+        match = _WHITESPACE.match(text, position)
+        assert match is not None
+        return match.end()
+    return position
+
+
+def _match_end(pattern: re.Pattern[str], text: str, position: int) -> int:
+    match = pattern.match(text, position)
+    assert match is not None
+    return match.end()
+
+
+def _skip_key(text: str, position: int) -> int:
+    match = _KEY.match(text, position)
+    if match is not None:
+        return match.end()
+    if text[position : position + 1] == '"':
+        raise json.JSONDecodeError("Expecting ':' delimiter", text, position)
+    msg = "Expecting property name enclosed in double quotes"
+    raise json.JSONDecodeError(msg, text, position)
+
+
+def _skip(text: str, position: int) -> int:
+    """
+    Return the offset just past the array or object at `position`,
+    raising `json.JSONDecodeError` unless all of it is valid JSON.
+
+    Nothing is decoded. Runs of scalar members are checked by regular
+    expressions, so the loop below only turns once per container.
+    """
+    match = _SMALL_CONTAINER.match(text, position)
+    if match is not None:
+        return match.end()
+    closers: List[str] = []
+    while True:
+        # At the start of a value.
+        char = text[position : position + 1]
+        if char == "[" or char == "{":
+            match = _SMALL_CONTAINER.match(text, position)
+            if match is None:
+                closer = "]" if char == "[" else "}"
+                closers.append(closer)
+                position = _skip_whitespace(text, position + 1)
+                if closer == "}":
+                    position = _skip_key(text, position)
+                continue
+            position = match.end()
+        else:
+            match = _SCALAR_RE.match(text, position)
+            if match is None:
+                raise json.JSONDecodeError("Expecting value", text, position)
+            position = match.end()
+        # After a value, close containers until another value follows.
+        while True:
+            if not closers:
+                return position
+            closer = closers[-1]
+            tail = _ARRAY_TAIL if closer == "]" else _OBJECT_TAIL
+            position = _match_end(tail, text, position)
+            char = text[position : position + 1]
+            if char == closer:
+                closers.pop()
+                position += 1
+                continue
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, position)
+            position = _skip_whitespace(text, position + 1)
+            if closer == "}":
+                position = _skip_key(text, position)
+            break
+
+
+class _Document:
+    """
+    The text of a lazily loaded document and the decoder for its values.
+    """
+
+    __slots__ = ("text", "decoder", "root", "_last_unicode_escape")
+
+    def __init__(self, text: str, decoder: json.JSONDecoder, root: int) -> None:
+        self.text = text
+        self.decoder = decoder
+        self.root = root
+        self._last_unicode_escape: Optional[int] = None
+
+    @property
+    def last_unicode_escape(self) -> int:
+        """The offset of the last `\\u` escape in the text, or -1."""
+        last = self._last_unicode_escape
+        if last is None:
+            # Looking for a single character is much faster, and most
+            # documents hold no backslash at all.
+            last = self.text.rfind("\\")
+            if last != -1:
+                last = self.text.rfind("\\u", 0, last + 2)
+            self._last_unicode_escape = last
+        return last
+
+    def decode(self, position: int) -> Tuple[Any, int]:
+        """Fully decode the value starting at `position`."""
+        return self.decoder.raw_decode(self.text, position)
+
+    def skip(self, position: int) -> int:
+        """Check the container at `position` and return its end."""
+        return self.finish(position, _skip(self.text, position))
+
+    def finish(self, start: int, end: int) -> int:
+        """
+        Record that the container at `start` ends at `end`, checking for
+        trailing data once the end of the whole document is known.
+        """
+        if start == self.root and _skip_whitespace(self.text, end) != len(self.text):
+            raise json.JSONDecodeError("Extra data", self.text, end)
+        return end
+
+
+class LazyValue:
+    """
+    Base class for read-only views over a JSON container that has not
+    been decoded yet.
+
+    Members are located one at a time, only as far as a lookup needs.
+    Containers that a lookup passes over are checked without being
+    decoded. The view keeps the original text, so an untouched container
+    can be written out again verbatim by `Encoder.dumps()`, once its
+    text has been checked to be valid JSON.
+    """
+
+    __slots__ = ("_document", "_start", "_end", "_position", "_pending")
+
+    def __init__(self, document: _Document, start: int) -> None:
+        self._document = document
+        self._start = start
+        self._end: Optional[int] = None
+        # Where the last scanned member ends, or -1 once all are scanned.
+        self._position = start + 1
+        # The last scanned member if it is a container, whose end is only
+        # looked up when scanning continues past it. `_position` then
+        # holds where it starts.
+        self._pending: Optional[LazyValue] = None
+
+    def _end_offset(self) -> int:
+        end = self._end
+        if end is None:
+            end = self._end = self._document.skip(self._start)
+        return end
+
+    @property
+    def raw(self) -> str:
+        """The exact JSON text of this container, after checking it."""
+        return self._document.text[self._start : self._end_offset()]
+
+    def to_bare(self) -> Any:
+        """Decode the whole container into plain dicts and lists."""
+        value, end = self._document.decode(self._start)
+        if self._end is None:
+            self._end = self._document.finish(self._start, end)
+        return value
+
+    def _advance(self, closer: str) -> int:
+        """
+        Move past the delimiter after the last scanned member and return
+        where the next one starts, or -1 once the container is closed.
+        """
+        position = self._position
+        if position == -1:
+            return -1
+        document = self._document
+        text = document.text
+        pending = self._pending
+        first = pending is None and position == self._start + 1
+        if pending is not None:
+            position = pending._end_offset()
+            self._pending = None
+        position = _skip_whitespace(text, position)
+        char = text[position : position + 1]
+        if char == closer:
+            self._position = -1
+            if self._end is None:
+                self._end = document.finish(self._start, position + 1)
+            return -1
+        if not first:
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, position)
+            position = _skip_whitespace(text, position + 1)
+        return position
+
+    def _take_value(self, position: int) -> Any:
+        """Return the member starting at `position` as a value or view."""
+        document = self._document
+        char = document.text[position : position + 1]
+        view: LazyValue
+        if char == "{":
+            view = LazyObject(document, position)
+        elif char == "[":
+            view = LazyArray(document, position)
+        else:
+            value, self._position = document.decode(position)
+            return value
+        self._position = position
+        self._pending = view
+        return view
+
+    def __repr__(self) -> str:
+        if self._end is None:
+            return f"{type(self).__name__}(<at offset {self._start}>)"
+        return f"{type(self).__name__}({self.raw!r})"
+
+
+class LazyObject(LazyValue, Mapping[str, Any]):
+    """
+    A read-only mapping over a JSON object. Looking up a key scans
+    members only until the key is found, and nested containers are
+    returned as further lazy views.
+    """
+
+    __slots__ = ("_members",)
+
+    def __init__(self, document: _Document, start: int) -> None:
+        super().__init__(document, start)
+        self._members: Dict[str, Any] = {}
+
+    def _scan_member(self) -> bool:
+        position = self._advance("}")
+        if position == -1:
+            return False
+        document = self._document
+        text = document.text
+        if text[position : position + 1] != '"':
+            msg = "Expecting property name enclosed in double quotes"
+            raise json.JSONDecodeError(msg, text, position)
+        key, position = document.decode(position)
+        position = _skip_whitespace(text, position)
+        if text[position : position + 1] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, position)
+        position = _skip_whitespace(text, position + 1)
+        self._members[key] = self._take_value(position)
+        return True
+
+    def _scan_all(self) -> Dict[str, Any]:
+        while self._scan_member():
+            pass
+        return self._members
+
+    def _may_repeat(self, key: str) -> bool:
+        """
+        Whether `key` could appear again in the members not scanned yet,
+        in which case the later value wins, as with `json.loads()`.
+
+        Other than through `\\u` escapes, and `\\/` for a slash, a key can
+        only be spelled one way, so searching the rest of the text for
+        that spelling rules most repeats out without scanning.
+        """
+        document = self._document
+        position = self._position
+        if document.last_unicode_escape >= position:
+            return True
+        text = document.text
+        end = self._end
+        if end is None and self._start != document.root:
+            # A nested object without deeper containers is quick to
+            # check in full, which bounds the search to its own text.
+            match = _SMALL_CONTAINER.match(text, self._start)
+            if match is not None:
+                end = self._end = match.end()
+        if end is None:
+            end = len(text)
+        if "/" in key and text.find("\\/", position, end) != -1:
+            return True
+        return text.find(json.dumps(key, ensure_ascii=False), position, end) != -1
+
+    def __getitem__(self, key: str) -> Any:
+        members = self._members
+        if self._position != -1:
+            while key not in members and self._scan_member():
+                pass
+            if self._position != -1 and self._may_repeat(key):
+                self._scan_all()
+        return members[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._scan_all())
+
+    def __len__(self) -> int:
+        return len(self._scan_all())
+
+
+class LazyArray(LazyValue, Sequence[Any]):
+    """
+    A read-only sequence over a JSON array. Indexing scans items only
+    up to the one asked for, and nested containers are returned as
+    further lazy views.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, document: _Document, start: int) -> None:
+        super().__init__(document, start)
+        self._items: List[Any] = []
+
+    def _scan_item(self) -> bool:
+        position = self._advance("]")
+        if position == -1:
+            return False
+        self._items.append(self._take_value(position))
+        return True
+
+    def _scan_all(self) -> List[Any]:
+        while self._scan_item():
+            pass
+        return self._items
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        items = self._items
+        if isinstance(index, slice) or index < 0:
+            return self._scan_all()[index]
+        while len(items) <= index and self._scan_item():
+            pass
+        return items[index]
+
+    def __len__(self) -> int:
+        return len(self._scan_all())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, tuple, LazyArray)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+def lazy_loads(
+    s: Union[str, bytes, bytearray],
+    *,
+    parse_float: Optional[Callable[[str], Any]] = None,
+    parse_int: Optional[Callable[[str], Any]] = None,
+    parse_constant: Optional[Callable[[str], Any]] = None,
+) -> Any:
+    """
+    Load a JSON document without decoding it up front.
+
+    Objects and arrays come back as read-only `LazyObject` and
+    `LazyArray` views, and `to_bare()` converts a view into plain dicts
+    and lists. Scalar documents are decoded immediately.
+
+    Nothing is checked or decoded until it is accessed. A lookup scans
+    members one at a time and stops at the one it needs. The containers
+    it passes over are checked for valid syntax without building any
+    Python objects, and are decoded only when accessed themselves. A
+    subtree that is never reached, such as a large array after the
+    fields being read, is never looked at. Syntax errors therefore
+    surface when the invalid part is accessed or written out. The
+    `parse_*` arguments behave like those of `json.loads()`.
+
+    `Encoder.dumps()` copies untouched views into its output as they
+    appear in the original text, whitespace included, after checking
+    that text in full. Passing `indent`, `separators`, `sort_keys=True`
+    or `allow_nan=False` makes it decode and re-encode them instead.
+    """
+    if isinstance(s, (bytes, bytearray)):
+        s = s.decode(json.detect_encoding(s), "surrogatepass")
+    if s.startswith("\ufeff"):
+        msg = "Unexpected UTF-8 BOM (decode using utf-8-sig)"
+        raise json.JSONDecodeError(msg, s, 0)
+    decoder = json.JSONDecoder(
+        parse_float=parse_float,
+        parse_int=parse_int,
+        parse_constant=parse_constant,
+    )
+    position = _skip_whitespace(s, 0)
+    document = _Document(s, decoder, position)
+    char = s[position : position + 1]
+    if char == "{":
+        return LazyObject(document, position)
+    if char == "[":
+        return LazyArray(document, position)
+    value, end = document.decode(position)
+    document.finish(position, end)
+    return value
+
+
+class RawFragments:
+    """
+    Lets a `json.JSONEncoder` write lazy views back out verbatim.
+
+    `placeholder()` returns a string for `default()` to hand to the
+    encoder, and `substitute()` swaps the encoded placeholders for the
+    original text once encoding is done.
+    """
+
+    def __init__(self) -> None:
+        self.fragments: List[str] = []
+        self.token = ""
+
+    def placeholder(self, raw: str) -> str:
+        if not self.token:
+            self.token = secrets.token_hex(8)
+        self.fragments.append(raw)
+        return f"\x00{self.token}:{len(self.fragments) - 1}\x00"
+
+    def substitute(self, text: str) -> str:
+        if not self.fragments:
+            return text
+        pattern = re.escape(f'"\\u0000{self.token}:') + r"(\d+)" + re.escape('\\u0000"')
+        fragments = self.fragments
+        return re.sub(pattern, lambda match: fragments[int(match.group(1))], text)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import mmap
+import os
+import sys
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Iterator, cast
+
+if os.name == "posix":
+    # The private module behind `SharedMemory` on POSIX, which has no
+    # type stubs. Opening segments through it is the only portable way
+    # to map one without registering it; macOS has no /dev/shm.
+    import _posixshmem  # type: ignore[import-not-found]
+
+
+@contextmanager
+def _attach(name: str) -> Iterator[memoryview]:
+    """
+    Map the segment called `name` and yield its buffer.
+
+    Only the process that created the segment should unlink it when it
+    exits, so readers must not register it with their resource tracker.
+    Before Python 3.13, `SharedMemory` always does that on POSIX. The
+    tracker may also be shared with the creator, e.g. in a
+    multiprocessing child, so unregistering afterwards would drop the
+    creator's registration too. The segment is mapped directly instead.
+    """
+    if sys.version_info >= (3, 13):
+        shm = SharedMemory(name=name, track=False)
+    elif os.name == "posix":
+        fd = _posixshmem.shm_open("/" + name, os.O_RDONLY)
+        try:
+            mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        try:
+            with memoryview(mapped) as buf:
+                yield buf
+        finally:
+            mapped.close()
+        return
+    else:
+        # Windows has no resource tracker for shared memory.
+        shm = SharedMemory(name=name)
+    try:
+        yield cast(memoryview, shm.buf)
+    finally:
+        shm.close()
+
+
+@dataclasses.dataclass(frozen=True)
+class SharedJSON:
+    """
+    A handle to JSON text held in a `multiprocessing.shared_memory`
+    segment, as returned by `Encoder.dump_shared()`.
+
+    The handle is small and picklable, so it can be sent to another
+    process in place of the text itself. The segment lives until
+    `unlink()` is called from any process. If nothing unlinks it, the
+    resource tracker of the creating process removes it at exit.
+    """
+
+    name: str
+    size: int
+
+    @classmethod
+    def create(cls, data: bytes) -> SharedJSON:
+        """Copy `data` into a new segment of exactly its size."""
+        shm = SharedMemory(create=True, size=max(len(data), 1))
+        buf = shm.buf
+        assert buf is not None
+        try:
+            buf[: len(data)] = data
+        finally:
+            shm.close()
+        return cls(name=shm.name, size=len(data))
+
+    @contextmanager
+    def open(self) -> Iterator[memoryview]:
+        """
+        Attach to the segment and yield a read-only `memoryview` of the
+        encoded UTF-8 bytes. The view is released on exit.
+        """
+        with _attach(self.name) as buf:
+            view = buf[: self.size].toreadonly()
+            try:
+                yield view
+            finally:
+                view.release()
+
+    def loads(self, *, unlink: bool = False, **kwargs: Any) -> Any:
+        """
+        Decode the payload with `json.loads()`, which receives any
+        extra keyword arguments. With `unlink=True` the segment is
+        removed once it has been read.
+        """
+        with self.open() as view:
+            text = str(view, "utf-8")
+        if unlink:
+            self.unlink()
+        return json.loads(text, **kwargs)
+
+    def unlink(self) -> None:
+        """Remove the segment. Existing attachments stay readable."""
+        shm = SharedMemory(name=self.name)
+        try:
+            shm.unlink()
+        finally:
+            shm.close()
@@ -0,0 +1,145 @@
+import dataclasses
+import hashlib
+import unittest
+from decimal import Decimal
+from typing import Any, Dict
+
+import easyjson
+
+
+@dataclasses.dataclass
+class Point:
+    y: int
+    x: int
+
+
+class TestCanonical(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.encoder = easyjson.Encoder(canonical=True)
+
+    def test_sorted_keys(self) -> None:
+        obj = {"b": 1, "a": {"d": Point(y=2, x=1), "c": None}}
+        expected = '{"a": {"c": null, "d": {"x": 1, "y": 2}}, "b": 1}'
+        self.assertEqual(expected, self.encoder.dumps(obj))
+        self.assertEqual(expected, self.encoder.dumps(obj, sort_keys=False))
+
+    def test_mixed_keys(self) -> None:
+        obj = {1: "a", "b": 2, 10: {None: [{2.5: True, False: 0}]}, 9: Point(y=1, x=2)}
+        expected = (
+            '{"1": "a", "10": {"null": [{"2.5": true, "false": 0}]}, '
+            '"9": {"x": 2, "y": 1}, "b": 2}'
+        )
+        self.assertEqual(expected, self.encoder.dumps(obj))
+        payload, digest = self.encoder.dumps_with_digest(obj)
+        self.assertEqual(expected.replace(", ", ",").replace(": ", ":"), payload)
+        self.assertEqual(digest.hexdigest(), self.encoder.digest(obj).hexdigest())
+        self.assertEqual(
+            '{\n "1": "a",\n "b": 2\n}',
+            self.encoder.dumps({1: "a", "b": 2}, indent=1),
+        )
+
+    def test_mixed_keys_unchanged(self) -> None:
+        obj = {1: "a", "b": [{2: 3}]}
+        self.encoder.dumps(obj)
+        self.assertEqual({1: "a", "b": [{2: 3}]}, obj)
+
+    def test_colliding_keys(self) -> None:
+        for obj in ({1: "a", "1": "b"}, [{True: 1, "true": 2}], {None: 1, "null": 2}):
+            with self.subTest(obj=obj):
+                with self.assertRaises(ValueError):
+                    self.encoder.dumps(obj)
+
+    def test_unsupported_keys(self) -> None:
+        obj = {(1, 2): 1, "a": 2}
+        with self.assertRaises(TypeError):
+            self.encoder.dumps(obj)
+        self.assertEqual('{"a": 2}', self.encoder.dumps(obj, skipkeys=True))
+
+    def test_circular(self) -> None:
+        obj: Dict[Any, Any] = {1: []}
+        obj[1].append(obj)
+        with self.assertRaises(ValueError):
+            self.encoder.dumps(obj)
+
+    def test_sets(self) -> None:
+        obj = {
+            "strs": {"c", "a", "b"},
+            "ints": frozenset({3, -1, 2}),
+            "mixed": {"a", 1, None, 2.5, (1, "b")},
+            "nested": [{frozenset({"y", "x"}), frozenset({"a"})}],
+        }
+        expected = (
+            '{"ints": [-1, 2, 3], "mixed": ["a", 1, 2.5, [1, "b"], null], '
+            '"nested": [[["a"], ["x", "y"]]], "strs": ["a", "b", "c"]}'
+        )
+        self.assertEqual(expected, self.encoder.dumps(obj))
+
+    def test_decimals(self) -> None:
+        cases = {
+            "1.5": ["1.5", "1.50", "15E-1", "0.15e1"],
+            "1E+2": ["100", "1E+2", "100.000"],
+            "0": ["0", "-0", "0.000", "0E+5"],
+            "NaN": ["NaN"],
+            "1.0000000000000000000000000000000001": [
+                "1.00000000000000000000000000000000010",
+            ],
+            "1E-1000000000000000000": [
+                "1E-1000000000000000000",
+                "10E-1000000000000000001",
+            ],
+            "1E+999999999999999993": ["1000E+999999999999999990"],
+        }
+        for expected, values in cases.items():
+            for value in values:
+                with self.subTest(value=value):
+                    actual = self.encoder.obj_to_bare(Decimal(value))
+                    self.assertEqual(expected, actual)
+
+    def test_decimals_not_canonical(self) -> None:
+        self.assertEqual("1.50", easyjson.Encoder().obj_to_bare(Decimal("1.50")))
+
+    def test_dumps_with_digest(self) -> None:
+        obj = {"b": {2, 1}, "a": Decimal("2.50")}
+        payload, digest = self.encoder.dumps_with_digest(obj)
+        self.assertEqual('{"a":"2.5","b":[1,2]}', payload)
+        expected = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        self.assertEqual(expected, digest.hexdigest())
+
+    def test_digest(self) -> None:
+        obj: Dict[str, Any] = {
+            "rows": [{"id": i, "tags": {str(i), "t"}} for i in range(20000)],
+            "text": "ü" * 100000,
+        }
+        payload = self.encoder.dumps(obj, separators=(",", ":"))
+        expected = hashlib.md5(payload.encode("utf-8")).hexdigest()
+        actual = self.encoder.digest(obj, algorithm="md5")
+        self.assertEqual("md5", actual.name)
+        self.assertEqual(expected, actual.hexdigest())
+        text, combined = self.encoder.dumps_with_digest(obj, algorithm="md5")
+        self.assertEqual(payload, text)
+        self.assertEqual(expected, combined.hexdigest())
+
+    def test_digest_matches_equal_values(self) -> None:
+        first = {"a": {"x", "y", "z"}, "b": Decimal("1.10")}
+        second = {"b": Decimal("1.1"), "a": {"z", "y", "x"}}
+        self.assertEqual(
+            self.encoder.digest(first).hexdigest(),
+            self.encoder.digest(second).hexdigest(),
+        )
+
+    def test_lazy_views(self) -> None:
+        view = easyjson.lazy_loads('{"b": 1,  "a": {"d": 2, "c": 3}}')
+        expected = '{"a": {"c": 3, "d": 2}, "b": 1}'
+        self.assertEqual(expected, self.encoder.dumps(view))
+
+    def test_requires_canonical(self) -> None:
+        encoder = easyjson.Encoder()
+        with self.assertRaises(RuntimeError):
+            encoder.digest({})
+        with self.assertRaises(RuntimeError):
+            encoder.dumps_with_digest({})
+
+    def test_to_bare(self) -> None:
+        self.assertTrue(self.encoder.to_bare()["canonical"])
+        self.assertFalse(easyjson.Encoder().to_bare()["canonical"])
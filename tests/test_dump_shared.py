@@ -0,0 +1,78 @@
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+from typing import Any
+
+import easyjson
+
+
+READER = """
+import sys
+import easyjson
+handle = easyjson.SharedJSON(name=sys.argv[1], size=int(sys.argv[2]))
+print(handle.loads()["a"])
+"""
+
+
+def load_shared(handle: easyjson.SharedJSON) -> Any:
+    return handle.loads()
+
+
+class TestDumpShared(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.encoder = easyjson.Encoder()
+
+    def test_open(self) -> None:
+        handle = self.encoder.dump_shared({"a": [1, 2]})
+        self.addCleanup(handle.unlink)
+        with handle.open() as view:
+            self.assertEqual(b'{"a": [1, 2]}', bytes(view))
+            self.assertTrue(view.readonly)
+
+    def test_loads(self) -> None:
+        obj = {"a": {1, 2}, "b": b"abcd", "c": "ü"}
+        handle = self.encoder.dump_shared(obj, ensure_ascii=False, sort_keys=True)
+        self.addCleanup(handle.unlink)
+        actual = handle.loads()
+        expected = {"a": [1, 2], "b": "YWJjZA==", "c": "ü"}
+        self.assertEqual(expected, actual)
+        text = '{"a": [1, 2], "b": "YWJjZA==", "c": "ü"}'
+        self.assertEqual(len(text.encode("utf-8")), handle.size)
+
+    def test_loads_unlink(self) -> None:
+        handle = self.encoder.dump_shared([1, 2, 3])
+        self.assertEqual([1, 2, 3], handle.loads(unlink=True))
+        with self.assertRaises(FileNotFoundError):
+            handle.loads()
+
+    def test_handle_is_picklable(self) -> None:
+        handle = self.encoder.dump_shared("abc")
+        self.addCleanup(handle.unlink)
+        self.assertEqual(handle, pickle.loads(pickle.dumps(handle)))
+
+    def test_other_process(self) -> None:
+        obj = {"rows": [[i, str(i)] for i in range(1000)]}
+        handle = self.encoder.dump_shared(obj)
+        self.addCleanup(handle.unlink)
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            actual = pool.apply(load_shared, (handle,))
+        self.assertEqual(self.encoder.obj_to_bare(obj, recursive=True), actual)
+
+    def test_independent_process(self) -> None:
+        handle = self.encoder.dump_shared({"a": "b"})
+        self.addCleanup(handle.unlink)
+        result = subprocess.run(
+            [sys.executable, "-c", READER, handle.name, str(handle.size)],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(easyjson.__file__))),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual("b\n", result.stdout)
+        self.assertEqual("", result.stderr)
+        # The reader exiting must not have removed the segment.
+        self.assertEqual({"a": "b"}, handle.loads())
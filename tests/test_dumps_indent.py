@@ -0,0 +1,98 @@
+import json
+import unittest
+from collections import OrderedDict
+from typing import Any, List
+
+import easyjson
+from tests.fixtures import SimpleDataclass, dt_stamp
+
+
+class TestDumpsIndent(unittest.TestCase):
+
+    def assertMatchesStdlib(self, obj: Any, **kwargs: Any) -> None:
+        expected = json.dumps(
+            obj,
+            default=lambda o: easyjson.default_encoder.obj_to_bare(o),
+            **kwargs,
+        )
+        actual = easyjson.dumps(obj, **kwargs)
+        self.assertEqual(expected, actual)
+
+    def test_simple(self) -> None:
+        obj = {"a": [1, 2], "b": {}}
+        actual = easyjson.dumps(obj, indent=2)
+        expected = '{\n  "a": [\n    1,\n    2\n  ],\n  "b": {}\n}'
+        self.assertEqual(expected, actual)
+
+    def test_scalar(self) -> None:
+        self.assertMatchesStdlib("abc", indent=2)
+        self.assertMatchesStdlib(1.5, indent=2)
+
+    def test_empty_containers(self) -> None:
+        self.assertMatchesStdlib([[], {}, [[]], {"a": {}}], indent=2)
+
+    def test_nested(self) -> None:
+        obj = {
+            "a": [1, 2.5, None, True, False, "x, [y] {z}"],
+            "b": {"c": [{"d": list(range(20))}], "e": (1, 2)},
+            "f": {str(i): i for i in range(20)},
+            "g": OrderedDict(b=1, a=2),
+        }
+        self.assertMatchesStdlib(obj, indent=2)
+        self.assertMatchesStdlib(obj, indent=0)
+        self.assertMatchesStdlib(obj, indent="\t")
+
+    def test_sort_keys(self) -> None:
+        obj = {
+            "b": {"d": 1, "c": [3, {"z": 1, "y": 2}]},
+            "a": {str(i): i for i in range(20)},
+        }
+        self.assertMatchesStdlib(obj, indent=2, sort_keys=True)
+
+    def test_separators(self) -> None:
+        obj = {"a": [1, 2, {"b": list(range(10))}]}
+        self.assertMatchesStdlib(obj, indent=2, separators=(", ", " = "))
+
+    def test_non_str_keys(self) -> None:
+        obj = {1: "a", 2.5: "b", None: "c", True: "d", "e": [1]}
+        self.assertMatchesStdlib(obj, indent=2)
+
+    def test_skipkeys(self) -> None:
+        obj = {(1, 2): "a", "b": {(3,): [1]}}
+        self.assertMatchesStdlib(obj, indent=2, skipkeys=True)
+
+    def test_ensure_ascii(self) -> None:
+        obj = {"ü": ["é"] * 10}
+        self.assertMatchesStdlib(obj, indent=2)
+        self.assertMatchesStdlib(obj, indent=2, ensure_ascii=False)
+
+    def test_easyjson_types(self) -> None:
+        obj = {
+            "set": {1, 2, 3},
+            "bytes": b"abcd",
+            "date": dt_stamp,
+            "dataclass": SimpleDataclass("a", 10, 100.0, [dt_stamp]),
+        }
+        self.assertMatchesStdlib(obj, indent=2, sort_keys=True)
+
+    def test_nan(self) -> None:
+        obj = [float("nan"), float("inf"), {"a": float("-inf")}]
+        self.assertMatchesStdlib(obj, indent=2)
+        with self.assertRaises(ValueError):
+            easyjson.dumps(obj, indent=2, allow_nan=False)
+
+    def test_circular(self) -> None:
+        obj: List[Any] = []
+        obj.append(obj)
+        with self.assertRaisesRegex(ValueError, "Circular reference detected"):
+            easyjson.dumps(obj, indent=2)
+
+    def test_bad_key(self) -> None:
+        with self.assertRaises(TypeError):
+            easyjson.dumps({(1, 2): "a"}, indent=2)
+
+    def test_encoder_class(self) -> None:
+        obj = {"a": {1, 2}, "b": [b"x"]}
+        actual = json.dumps(obj, cls=easyjson.Encoder().Class, indent=2)
+        expected = '{\n  "a": [\n    1,\n    2\n  ],\n  "b": [\n    "eA=="\n  ]\n}'
+        self.assertEqual(expected, actual)
@@ -0,0 +1,178 @@
+import json
+import unittest
+from collections.abc import Mapping, Sequence
+from decimal import Decimal
+
+import easyjson
+
+DOCUMENT = json.dumps(
+    {
+        "id": 7,
+        "name": "x, [y] {z} \"quoted\" \\",
+        "tags": ["a", "b"],
+        "meta": {"score": 1.5, "empty": {}, "items": [[], [1, {"k": None}]]},
+    }
+)
+
+
+class TestLazyLoads(unittest.TestCase):
+
+    def test_object_view(self) -> None:
+        view = easyjson.lazy_loads(DOCUMENT)
+        self.assertIsInstance(view, easyjson.LazyObject)
+        self.assertIsInstance(view, Mapping)
+        self.assertEqual(["id", "name", "tags", "meta"], list(view))
+        self.assertEqual(4, len(view))
+        self.assertEqual(7, view["id"])
+        self.assertEqual("x, [y] {z} \"quoted\" \\", view["name"])
+        self.assertNotIn("missing", view)
+
+    def test_nested_views(self) -> None:
+        view = easyjson.lazy_loads(DOCUMENT)
+        tags = view["tags"]
+        self.assertIsInstance(tags, easyjson.LazyArray)
+        self.assertIsInstance(tags, Sequence)
+        self.assertEqual("b", tags[1])
+        self.assertEqual(["a"], tags[:1])
+        self.assertIsNone(view["meta"]["items"][1][1]["k"])
+
+    def test_equality(self) -> None:
+        view = easyjson.lazy_loads(DOCUMENT)
+        self.assertEqual(json.loads(DOCUMENT), view)
+        self.assertEqual(view["tags"], ["a", "b"])
+
+    def test_bytes(self) -> None:
+        view = easyjson.lazy_loads('{"a": "ü"}'.encode("utf-8"))
+        self.assertEqual("ü", view["a"])
+
+    def test_scalar_document(self) -> None:
+        self.assertEqual(1.5, easyjson.lazy_loads(" 1.5 "))
+        self.assertEqual("abc", easyjson.lazy_loads('"abc"'))
+
+    def test_whitespace(self) -> None:
+        view = easyjson.lazy_loads(json.dumps(json.loads(DOCUMENT), indent=2))
+        self.assertEqual(json.loads(DOCUMENT), view)
+
+    def test_to_bare(self) -> None:
+        view = easyjson.lazy_loads(DOCUMENT)
+        actual = view["meta"].to_bare()
+        self.assertIs(dict, type(actual))
+        self.assertEqual(json.loads(DOCUMENT)["meta"], actual)
+
+    def test_parse_float(self) -> None:
+        view = easyjson.lazy_loads(DOCUMENT, parse_float=Decimal)
+        self.assertEqual(Decimal("1.5"), view["meta"]["score"])
+        self.assertEqual(Decimal("1.5"), view["meta"].to_bare()["score"])
+
+    def test_raw(self) -> None:
+        view = easyjson.lazy_loads('{"a": [1,  2], "b": {}}')
+        self.assertEqual("[1,  2]", view["a"].raw)
+
+    def test_dumps_verbatim(self) -> None:
+        view = easyjson.lazy_loads('{"a": [1,  2], "b": {"c":true}}')
+        self.assertEqual('{"a": [1,  2], "b": {"c":true}}', easyjson.dumps(view))
+        actual = easyjson.dumps({"x": view["b"], "y": view["a"]})
+        self.assertEqual('{"x": {"c":true}, "y": [1,  2]}', actual)
+
+    def test_dumps_verbatim_non_ascii(self) -> None:
+        view = easyjson.lazy_loads('{"a": ["ü"]}')
+        self.assertEqual('{"a": ["\\u00fc"]}', easyjson.dumps(view))
+        self.assertEqual('{"a": ["ü"]}', easyjson.dumps(view, ensure_ascii=False))
+
+    def test_dumps_reformatted(self) -> None:
+        view = easyjson.lazy_loads('{"b": [1,  2], "a": {"d": 1, "c": 2}}')
+        actual = easyjson.dumps(view, sort_keys=True)
+        expected = '{"a": {"c": 2, "d": 1}, "b": [1, 2]}'
+        self.assertEqual(expected, actual)
+        actual = easyjson.dumps(view, indent=2)
+        expected = json.dumps(view.to_bare(), indent=2)
+        self.assertEqual(expected, actual)
+
+    def test_dumps_separators(self) -> None:
+        view = easyjson.lazy_loads('{"a": [1, 2],\n "b": {"c": 1}}')
+        actual = easyjson.dumps(view, separators=(",", ":"))
+        self.assertEqual('{"a":[1,2],"b":{"c":1}}', actual)
+        actual = easyjson.dumps(view, separators=(", ", ": "))
+        self.assertEqual('{"a": [1, 2],\n "b": {"c": 1}}', actual)
+
+    def test_dumps_allow_nan(self) -> None:
+        view = easyjson.lazy_loads("[NaN, 1]")
+        self.assertEqual('{"a": [NaN, 1]}', easyjson.dumps({"a": view}))
+        with self.assertRaises(ValueError):
+            easyjson.dumps({"a": view}, allow_nan=False)
+
+    def test_errors(self) -> None:
+        for document in ("", "  ", "tru", "1 2", '"a'):
+            with self.subTest(document=document):
+                with self.assertRaises(json.JSONDecodeError):
+                    easyjson.lazy_loads(document)
+
+    def test_errors_on_access(self) -> None:
+        documents = (
+            "[1] x",
+            "[1]]",
+            '{"a": [}',
+            '{"a": "b}',
+            "[1,]",
+            '{"a" 1}',
+            "[1 2]",
+            '{"a": 1,}',
+            '{"a": [1,, 2], "b": tru}',
+            '[{"a": [[["\\q"]]]}]',
+            '[[[[[1, 2}]]]]',
+        )
+        for document in documents:
+            with self.subTest(document=document):
+                view = easyjson.lazy_loads(document)
+                with self.assertRaises(json.JSONDecodeError):
+                    len(view)
+                with self.assertRaises(json.JSONDecodeError):
+                    view.to_bare()
+                with self.assertRaises(json.JSONDecodeError):
+                    easyjson.dumps({"w": view})
+
+    def test_dumps_never_invalid(self) -> None:
+        view = easyjson.lazy_loads('{"a": [1,, 2]}')
+        with self.assertRaises(json.JSONDecodeError):
+            easyjson.dumps({"w": view["a"]})
+        view = easyjson.lazy_loads('[[[[{"c": tru}]]]]')
+        with self.assertRaises(json.JSONDecodeError):
+            easyjson.dumps({"w": view[0][0]})
+
+    def test_untouched_parts_not_scanned(self) -> None:
+        view = easyjson.lazy_loads('{"a": {"b": 1}, "c": [1,, 2], "d": 2 2}')
+        self.assertEqual(1, view["a"]["b"])
+        self.assertEqual('{"b": 1}', view["a"].raw)
+        view = easyjson.lazy_loads("[[1], [2], [3,,]")
+        self.assertEqual([2], view[1])
+
+    def test_duplicate_keys(self) -> None:
+        documents = (
+            '{"a": 1, "b": {"a": 2}, "a": 3}',
+            '{"a": 1, "b": [], "\\u0061": 3}',
+            '{"a/b": 1, "a\\/b": 3}',
+        )
+        for document in documents:
+            with self.subTest(document=document):
+                view = easyjson.lazy_loads(document)
+                key = next(iter(json.loads(document)))
+                self.assertEqual(3, view[key])
+                self.assertEqual(json.loads(document), view)
+        nested = easyjson.lazy_loads('{"x": {"a": 1, "a": 3}, "y": {"a": 2}}')
+        self.assertEqual(3, nested["x"]["a"])
+
+    def test_array_indexing(self) -> None:
+        view = easyjson.lazy_loads("[0, [1], {\"2\": 2}, 3]")
+        self.assertEqual(3, view[-1])
+        self.assertEqual([0, [1]], view[:2])
+        self.assertEqual(4, len(view))
+        with self.assertRaises(IndexError):
+            view[4]
+        self.assertEqual([0, [1], {"2": 2}, 3], list(view))
+
+    def test_dumps_always_valid(self) -> None:
+        view = easyjson.lazy_loads('{"a": [1, {"b": [true, null]}], "c": {"d": "e"}}')
+        for value in (view, view["a"], view["a"][1]):
+            with self.subTest(value=value):
+                actual = json.loads(easyjson.dumps({"w": value}))
+                self.assertEqual({"w": value.to_bare()}, actual)